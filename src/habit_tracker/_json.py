@@ -0,0 +1,30 @@
+"""
+JSON encoding helpers shared by the models and the storage layer.
+
+Uses orjson (parses/serializes in C) when it is installed and falls back
+to the stdlib json module otherwise. Both produce UTF-8 bytes.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize `data` to UTF-8 JSON bytes, optionally indented by 2 spaces."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def loads(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes. Raises a ValueError subclass on bad input."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
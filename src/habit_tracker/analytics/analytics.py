@@ -4,6 +4,7 @@ Analytics module for Habit Tracker.
 Implements pure functions to:
 - Return list of all habits
 - Return list of habits with the same periodicity
+- Group habits by periodicity in a single pass
 - Return longest run streak across all habits
 - Return longest run streak for a given habit
 
@@ -12,107 +13,65 @@ Streak Rules:
 - Weekly: A streak continues only if there is at least one event in each consecutive ISO week.
 """
 
-from datetime import datetime, timedelta
-from typing import Iterable, List, Tuple, Optional
-from ..models import Habit
+from typing import Dict, Iterable, List, Tuple, Optional
+from ..models import Habit, HabitRegistry, VALID_PERIODICITIES
 
 
-# -------------------- Helpers (Pure Functions) --------------------
-
-def _period_key(dt: datetime, periodicity: str) -> Tuple[int, int]:
-    """
-    Map a datetime to a (year, ordinal) key per periodicity.
-
-    Parameters
-    ----------
-    dt : datetime
-        Event timestamp
-    periodicity : str
-        Either 'daily' or 'weekly'
-
-    Returns
-    -------
-    Tuple[int, int]
-        (year, day_of_year) for daily or (iso_year, iso_week) for weekly
-    """
-    if periodicity == "daily":
-        return (dt.year, dt.timetuple().tm_yday)
-    elif periodicity == "weekly":
-        iso_year, iso_week, _ = dt.isocalendar()
-        return (iso_year, iso_week)
-    else:
-        raise ValueError("Invalid periodicity; must be 'daily' or 'weekly'")
-
+# -------------------- Required Analytics Functions --------------------
 
-def _previous_period_key(key: Tuple[int, int], periodicity: str) -> Tuple[int, int]:
+def list_all(habits: Iterable[Habit]) -> List[Habit]:
     """
-    Get the previous period key (one day or one ISO week earlier).
+    Return all habits as a list.
 
     Parameters
     ----------
-    key : Tuple[int, int]
-        Current period key
-    periodicity : str
-        Either 'daily' or 'weekly'
+    habits : Iterable[Habit]
 
     Returns
     -------
-    Tuple[int, int]
-        Previous period key
-    """
-    if periodicity == "daily":
-        year, day = key
-        base = datetime(year, 1, 1) + timedelta(days=day - 1)
-        prev = base - timedelta(days=1)
-        return (prev.year, prev.timetuple().tm_yday)
-    else:  # weekly
-        year, week = key
-        monday = _iso_to_monday(year, week)
-        prev_monday = monday - timedelta(weeks=1)
-        prev_iso_year, prev_iso_week, _ = prev_monday.isocalendar()
-        return (prev_iso_year, prev_iso_week)
-
-
-def _iso_to_monday(iso_year: int, iso_week: int) -> datetime:
-    """
-    Return the Monday datetime for a given ISO year/week.
+    List[Habit]
     """
-    jan4 = datetime(iso_year, 1, 4)
-    iso1_monday = jan4 - timedelta(days=jan4.isoweekday() - 1)
-    return iso1_monday + timedelta(weeks=iso_week - 1)
-
+    return list(habits)
 
-# -------------------- Required Analytics Functions --------------------
 
-def list_all(habits: Iterable[Habit]) -> List[Habit]:
+def list_by_periodicity(habits: Iterable[Habit], periodicity: str) -> List[Habit]:
     """
-    Return all habits as a list.
+    Filter habits by periodicity ('daily' or 'weekly').
 
     Parameters
     ----------
     habits : Iterable[Habit]
+    periodicity : str
 
     Returns
     -------
     List[Habit]
+        Uses the registry's periodicity index when given a HabitRegistry.
     """
-    return list(habits)
+    if isinstance(habits, HabitRegistry):
+        return habits.by_periodicity(periodicity)
+    return [h for h in habits if h.periodicity == periodicity]
 
 
-def list_by_periodicity(habits: Iterable[Habit], periodicity: str) -> List[Habit]:
+def group_by_periodicity(habits: Iterable[Habit]) -> Dict[str, List[Habit]]:
     """
-    Filter habits by periodicity ('daily' or 'weekly').
+    Split habits by periodicity in one pass.
+
+    Use this instead of calling `list_by_periodicity` once per periodicity.
 
     Parameters
     ----------
     habits : Iterable[Habit]
-    periodicity : str
 
     Returns
     -------
-    List[Habit]
+    Dict[str, List[Habit]]
+        One (possibly empty) list per valid periodicity, in input order.
     """
-    return [h for h in habits if h.periodicity == periodicity]
+    groups: Dict[str, List[Habit]] = {p: [] for p in sorted(VALID_PERIODICITIES)}
+    for h in habits:
+        groups[h.periodicity].append(h)
+    return groups
 
 
 def longest_run_streak_for(habit: Habit) -> int:
@@ -129,28 +88,17 @@ def longest_run_streak_for(habit: Habit) -> int:
     int
         Longest streak for the habit
     """
-    if not habit.events:
-        return 0
-
-    # Build sorted unique period keys where completion exists
-    keys = sorted({_period_key(ev.timestamp, habit.periodicity) for ev in habit.events})
-
-    # Sweep to find longest consecutive chain
-    best = 1
-    current = 1
-    for prev, cur in zip(keys, keys[1:]):
-        if _previous_period_key(cur, habit.periodicity) == prev:
-            current += 1
-            best = max(best, current)
-        else:
-            current = 1
-    return best
+    # Habit keeps its streak index up to date on every check-off
+    return habit.longest_streak()
 
 
 def longest_run_streak_all(habits: Iterable[Habit]) -> Tuple[Optional[str], int]:
     """
     Return (habit_name, longest_streak) across all habits.
 
+    Each habit's longest streak is cached on the Habit and kept current by
+    `check_off`, so this is one field read per habit and needs no memo.
+
     Parameters
     ----------
     habits : Iterable[Habit]
@@ -10,8 +10,8 @@ Features:
 """
 
 from datetime import datetime
-from typing import List
-from .models import Habit
+from typing import List, Optional
+from .models import Habit, HabitRegistry
 from .storage.json_store import load_habits, save_habits, DEFAULT_DB_PATH
 from .analytics.analytics import (
     list_all,
@@ -30,15 +30,19 @@ def _choose(prompt: str, options: List[str]) -> int:
     for i, opt in enumerate(options, start=1):
         print(f"  {i}. {opt}")
     while True:
-        try:
-            n = int(input("Select option: "))
-            if 1 <= n <= len(options):
-                return n
-        except ValueError:
-            pass
+        n = _input_int("Select option: ")
+        if n is not None and 1 <= n <= len(options):
+            return n
         print("Invalid choice. Try again.")
 
 
+def _input_int(prompt: str) -> Optional[int]:
+    """Read a non-negative integer; return None if the input is not a number."""
+    s = input(prompt).strip()
+    # isdecimal() accepts exactly what int() parses here, so no exception path
+    return int(s) if s.isdecimal() else None
+
+
 def _input_nonempty(prompt: str) -> str:
     """Prompt until user enters a non-empty string."""
     while True:
@@ -52,7 +56,7 @@ def _input_nonempty(prompt: str) -> str:
 
 def main() -> None:
     print("🌱 Habit Tracker (IU Portfolio) – JSON DB:", DEFAULT_DB_PATH)
-    habits: List[Habit] = load_habits()
+    habits = HabitRegistry(load_habits())
 
     MENU = [
         "List all habits",
@@ -75,7 +79,7 @@ def main() -> None:
             if not habits:
                 print("No habits found.")
             for h in list_all(habits):
-                print(f" - {h.name} [{h.periodicity}] created {h.created_at.date()} | completions={len(h.events)}")
+                print(f" - {h.name} [{h.periodicity}] created {h.created_at.date()} | completions={h.event_count}")
 
         # 2) List by periodicity
         elif choice == 2:
@@ -104,8 +108,8 @@ def main() -> None:
                 continue
             for i, h in enumerate(habits, start=1):
                 print(f"  {i}. {h.name}")
-            idx = int(input("Choose habit number to delete: "))
-            if 1 <= idx <= len(habits):
+            idx = _input_int("Choose habit number to delete: ")
+            if idx is not None and 1 <= idx <= len(habits):
                 removed = habits.pop(idx - 1)
                 save_habits(habits)
                 print(f"Deleted '{removed.name}'.")
@@ -119,8 +123,8 @@ def main() -> None:
                 continue
             for i, h in enumerate(habits, start=1):
                 print(f"  {i}. {h.name} [{h.periodicity}]")
-            idx = int(input("Choose habit to mark complete: "))
-            if 1 <= idx <= len(habits):
+            idx = _input_int("Choose habit to mark complete: ")
+            if idx is not None and 1 <= idx <= len(habits):
                 habits[idx - 1].check_off()  # Updated API usage
                 save_habits(habits)
                 print(f"Marked '{habits[idx-1].name}' complete at now.")
@@ -142,8 +146,8 @@ def main() -> None:
                 continue
             for i, h in enumerate(habits, start=1):
                 print(f"  {i}. {h.name}")
-            idx = int(input("Choose habit: "))
-            if 1 <= idx <= len(habits):
+            idx = _input_int("Choose habit: ")
+            if idx is not None and 1 <= idx <= len(habits):
                 h = habits[idx - 1]
                 s = longest_run_streak_for(h)
                 print(f"'{h.name}' longest streak: {s}")
@@ -153,7 +157,7 @@ def main() -> None:
         # 8) Seed demo data
         elif choice == 8:
             load_fixture_into_db()
-            habits = load_habits()
+            habits = HabitRegistry(load_habits())
             print("Demo data loaded.")
 
         # 9) Save & Exit
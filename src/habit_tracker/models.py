@@ -1,17 +1,27 @@
 """
-OOP model for a Habit, HabitEvent, and helper utilities.
+OOP model for a Habit, HabitEvent, HabitRegistry, and helper utilities.
 Python 3.7+ compatible.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from array import array
+from bisect import bisect_right, insort
+from operator import le
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Literal
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Literal
+
+from . import _json
 
 # ----------------- Constants -----------------
 VALID_PERIODICITIES = {"daily", "weekly"}
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+;
+# older versions fall back to regular dataclasses.
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 def start_of_week(d: datetime) -> datetime:
     """Return Monday 00:00 of the week containing datetime d."""
@@ -19,8 +29,48 @@ def start_of_week(d: datetime) -> datetime:
     return datetime(monday.year, monday.month, monday.day)
 
 
+def to_timestamp(d: datetime) -> int:
+    """
+    Encode a naive datetime as whole seconds since 0001-01-01 00:00.
+
+    Timezone-free (unlike datetime.timestamp()); sub-second precision is dropped.
+    """
+    return (d.toordinal() - 1) * 86400 + d.hour * 3600 + d.minute * 60 + d.second
+
+
+_EPOCH = datetime(1, 1, 1)
+
+
+def from_timestamp(ts: int) -> datetime:
+    """Decode seconds since 0001-01-01 00:00 (see `to_timestamp`) to a datetime."""
+    return _EPOCH + timedelta(0, ts)
+
+
+# Period length in timestamp seconds. Timestamps count from Monday
+# 0001-01-01 00:00, so `ts // period` is the day index (daily) or the
+# ISO week index (weekly); consecutive periods get consecutive keys.
+_PERIOD_SECONDS: Dict[str, int] = {"daily": 86400, "weekly": 7 * 86400}
+
+# One-byte event status codes. Code 0 is 'completed'; statuses not listed
+# here get the next free code on first use. Codes only live in memory,
+# files always store the status strings.
+_STATUS_NAMES: List[str] = ["completed", "skipped", "missed"]
+_STATUS_CODES: Dict[str, int] = {name: code for code, name in enumerate(_STATUS_NAMES)}
+
+
+def _status_code(status: str) -> int:
+    """Return the one-byte code for `status`, registering it if new."""
+    code = _STATUS_CODES.get(status)
+    if code is None:
+        if len(_STATUS_NAMES) > 255:
+            raise ValueError("too many distinct event statuses")
+        code = _STATUS_CODES[status] = len(_STATUS_NAMES)
+        _STATUS_NAMES.append(status)
+    return code
+
+
 # ----------------- Event Class -----------------
-@dataclass
+@dataclass(**_SLOTS)
 class HabitEvent:
     """
     Represents a single completion event for a habit.
@@ -49,7 +99,6 @@ class HabitEvent:
 
 
 # ----------------- Habit Class -----------------
-@dataclass
 class Habit:
     """
     Represents a habit with a periodicity and a list of completion events.
@@ -63,20 +112,84 @@ class Habit:
     created_at : datetime
         When the habit was created.
     events : List[HabitEvent]
-        List of completion events for this habit.
+        Completion events for this habit (read-only view, see below).
+
+    Events are stored column-wise, in chronological order: a packed
+    `array('q')` of integer timestamps (see `to_timestamp`, whole seconds)
+    plus a parallel `bytearray` of one-byte status codes, so an event costs
+    9 bytes. `events` builds HabitEvent objects from those columns on each
+    access, so add completions with `check_off`/`bulk_check_off`; appending
+    to the returned list has no effect. Streak state (completed period keys
+    and run lengths) is built once and then maintained by `check_off`.
     """
 
-    name: str
-    periodicity: Literal["daily", "weekly"]
-    created_at: datetime
-    events: List[HabitEvent] = field(default_factory=list)
+    __slots__ = (
+        "name", "periodicity", "created_at",
+        # Event columns
+        "_ts", "_status_codes",
+        # Incremental streak index (not part of the public data)
+        "_period_keys", "_sorted_keys", "_runs", "_longest",
+        # Period length in seconds, bound once since periodicity is fixed per habit
+        "_period",
+    )
 
-    def __post_init__(self) -> None:
-        if self.periodicity not in VALID_PERIODICITIES:
+    def __init__(
+        self,
+        name: str,
+        periodicity: Literal["daily", "weekly"],
+        created_at: datetime,
+        events: Optional[Iterable[HabitEvent]] = None,
+    ) -> None:
+        if periodicity not in VALID_PERIODICITIES:
             raise ValueError("periodicity must be 'daily' or 'weekly'")
+        self.name = name
+        self.periodicity = periodicity
+        self.created_at = created_at
+        self._ts = array("q")
+        self._status_codes = bytearray()
+        for ev in events or ():
+            self._ts.append(to_timestamp(ev.timestamp))
+            self._status_codes.append(_status_code(ev.status))
+        self._sort_events()
+        self._period = _PERIOD_SECONDS[periodicity]
+        self._rebuild_index()
+
+    def __repr__(self) -> str:
+        return (
+            f"Habit(name={self.name!r}, periodicity={self.periodicity!r}, "
+            f"created_at={self.created_at!r}, events=<{len(self._ts)} events>)"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Habit):
+            return NotImplemented
+        return (
+            self.name == other.name
+            and self.periodicity == other.periodicity
+            and self.created_at == other.created_at
+            and self._ts == other._ts
+            and self._status_codes == other._status_codes
+        )
+
+    __hash__ = None  # mutable, like the dataclass it replaces
+
+    # ---------- Events ----------
+    @property
+    def events(self) -> List[HabitEvent]:
+        """Completion events, materialized from the timestamp column."""
+        names = _STATUS_NAMES
+        return [
+            HabitEvent(_EPOCH + timedelta(0, ts), names[code])
+            for ts, code in zip(self._ts, self._status_codes)
+        ]
+
+    @property
+    def event_count(self) -> int:
+        """Number of completion events, without materializing them."""
+        return len(self._ts)
 
     # ---------- Core behavior ----------
-    def check_off(self, dt: Optional[datetime] = None) -> None:
+    def check_off(self, dt: Optional[datetime] = None, status: str = "completed") -> None:
         """
         Mark this habit as completed at the given datetime (default: now).
 
@@ -84,32 +197,109 @@ class Habit:
         ----------
         dt : datetime, optional
             Completion timestamp. Defaults to current time.
+        status : str
+            Event status; default 'completed'.
         """
-        dt = dt or datetime.now()
-        self.events.append(HabitEvent(timestamp=dt))
+        ts = to_timestamp(dt or datetime.now())
+        code = _status_code(status)
+        if not self._ts or ts >= self._ts[-1]:
+            # Usual case: the newest completion goes at the end
+            self._ts.append(ts)
+            self._status_codes.append(code)
+        else:
+            # Back-dated completion: insert in place to keep events chronological
+            i = bisect_right(self._ts, ts)
+            self._ts.insert(i, ts)
+            self._status_codes.insert(i, code)
+        key = ts // self._period
+        if self._add_period(key):
+            keys = self._sorted_keys
+            if not keys or key > keys[-1]:
+                keys.append(key)  # usual case: checking off the latest period
+            else:
+                insort(keys, key)
 
-    # ---------- Period helpers ----------
-    def _period_key(self, d: datetime) -> datetime:
+    def bulk_check_off(self, dts: Iterable[datetime]) -> None:
         """
-        Normalize a datetime to the period "key":
-        - daily  -> that day's midnight
-        - weekly -> Monday 00:00 of that ISO week
-        """
-        return datetime(d.year, d.month, d.day) if self.periodicity == "daily" else start_of_week(d)
+        Mark this habit as completed at each of the given datetimes.
+
+        Equivalent to calling `check_off` for each datetime, but the streak
+        index is rebuilt once at the end instead of updated per event.
 
-    def _period_step(self) -> timedelta:
-        """Step size between consecutive periods for this habit."""
-        return timedelta(days=1) if self.periodicity == "daily" else timedelta(days=7)
+        Parameters
+        ----------
+        dts : Iterable[datetime]
+            Completion timestamps, in any order.
+        """
+        new = sorted(map(to_timestamp, dts))
+        back_dated = new and self._ts and new[0] < self._ts[-1]
+        self._ts.extend(new)
+        self._status_codes.extend(bytes(len(new)))  # code 0: completed
+        if back_dated:
+            self._sort_events()
+        self._rebuild_index()
 
     # ---------- Streak helpers ----------
-    def unique_completed_periods(self) -> List[datetime]:
+    def _sort_events(self) -> None:
+        """Put the event columns in chronological order (stable; no-op if already sorted)."""
+        ts = self._ts
+        if all(map(le, ts, ts[1:])):
+            return
+        order = sorted(range(len(ts)), key=ts.__getitem__)
+        self._ts = array("q", [ts[i] for i in order])
+        codes = self._status_codes
+        self._status_codes = bytearray(codes[i] for i in order)
+
+    def _rebuild_index(self) -> None:
+        """
+        Rebuild the streak index from all events in one batch.
+
+        Keys are deduplicated and sorted once, then a single sweep finds each
+        run of consecutive keys and records its length at both endpoints.
+        """
+        period = self._period
+        self._period_keys = {ts // period for ts in self._ts}
+        self._sorted_keys = keys = sorted(self._period_keys)
+        self._runs = runs = {}
+        longest = start = 0
+        n = len(keys)
+        for i in range(1, n + 1):
+            if i == n or keys[i] - keys[i - 1] != 1:
+                run = i - start
+                runs[keys[start]] = runs[keys[i - 1]] = run
+                if run > longest:
+                    longest = run
+                start = i
+        self._longest = longest
+
+    def _add_period(self, key: int) -> bool:
+        """
+        Record a completed period and merge it with adjacent runs.
+        Returns False if the period was already completed.
+
+        `_runs` holds the run length at both endpoints of every run, so the
+        runs ending at key-1 and starting at key+1 are found in O(1).
+        The caller keeps `_sorted_keys` in order.
+        """
+        if key in self._period_keys:
+            return False
+        self._period_keys.add(key)
+        left = self._runs.get(key - 1, 0)
+        right = self._runs.get(key + 1, 0)
+        run = left + 1 + right
+        self._runs[key - left] = run
+        self._runs[key + right] = run
+        if run > self._longest:
+            self._longest = run
+        return True
+
+    def unique_completed_periods(self) -> List[int]:
         """Return sorted unique period keys that have at least one completion."""
-        keys = {self._period_key(ev.timestamp) for ev in self.events}
-        return sorted(keys)
+        return list(self._sorted_keys)
 
     def longest_streak(self) -> int:
         """
-        Compute the longest consecutive run of completed periods.
+        Return the longest consecutive run of completed periods.
         Duplicates in the same period are ignored.
 
         Returns
@@ -117,35 +307,120 @@ class Habit:
         int
             Length of the longest streak (in periods).
         """
-        periods = self.unique_completed_periods()
-        if not periods:
-            return 0
-        step = self._period_step()
-        longest = cur = 1
-        for prev, nxt in zip(periods, periods[1:]):
-            if nxt - prev == step:
-                cur += 1
-                longest = max(longest, cur)
-            else:
-                cur = 1
-        return longest
+        return self._longest
+
+    def current_streak(self) -> int:
+        """
+        Return the length of the streak ending at the most recent completed
+        period (0 if there are no completions).
+
+        The latest period always ends its run, so this is a lookup in the
+        run index maintained by `check_off`.
+        """
+        keys = self._sorted_keys
+        return self._runs[keys[-1]] if keys else 0
 
     # ---------- Serialization ----------
     def to_dict(self) -> Dict[str, Any]:
-        """Convert Habit (and events) to a JSON-serializable dict."""
-        return {
+        """
+        Convert Habit (and events) to a JSON-serializable dict.
+
+        Events are stored column-wise: `event_ts` holds one integer timestamp
+        per event (see `to_timestamp`). `event_status` is a parallel list that
+        is only written when some event is not 'completed'.
+        """
+        data: Dict[str, Any] = {
             "name": self.name,
             "periodicity": self.periodicity,
             "created_at": self.created_at.isoformat(),
-            "events": [ev.to_dict() for ev in self.events],
+            "event_ts": self._ts.tolist(),
         }
+        if any(self._status_codes):  # some event is not 'completed' (code 0)
+            data["event_status"] = [_STATUS_NAMES[code] for code in self._status_codes]
+        return data
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "Habit":
-        """Rehydrate Habit (and events) from a dict."""
-        return Habit(
+        """
+        Rehydrate Habit (and events) from a dict.
+
+        Accepts the columnar `event_ts` layout as well as the older
+        `events` list of {"timestamp", "status"} dicts and the original
+        `completed_datetimes` list of ISO strings (e.g. data/habits.json).
+        """
+        habit = Habit(
             name=data["name"],
             periodicity=data["periodicity"],
             created_at=datetime.fromisoformat(data["created_at"]),
-            events=[HabitEvent.from_dict(ev) for ev in data.get("events", [])],
         )
+        if "event_ts" in data:
+            # Columns load as-is: no per-event datetime or HabitEvent objects
+            habit._ts = array("q", data["event_ts"])
+            statuses = data.get("event_status")
+            habit._status_codes = (
+                bytearray(map(_status_code, statuses)) if statuses else bytearray(len(habit._ts))
+            )
+        elif "completed_datetimes" in data:
+            habit._ts = array("q", [to_timestamp(datetime.fromisoformat(ts)) for ts in data["completed_datetimes"]])
+            habit._status_codes = bytearray(len(habit._ts))
+        else:
+            events = [HabitEvent.from_dict(ev) for ev in data.get("events", [])]
+            habit._ts = array("q", [to_timestamp(ev.timestamp) for ev in events])
+            habit._status_codes = bytearray(_status_code(ev.status) for ev in events)
+        habit._sort_events()
+        habit._rebuild_index()
+        return habit
+
+    def to_bytes(self) -> bytes:
+        """Serialize this habit to compact JSON bytes (see `to_dict`)."""
+        return _json.dumps(self.to_dict())
+
+    @staticmethod
+    def from_bytes(raw: bytes) -> "Habit":
+        """Rehydrate a Habit from bytes produced by `to_bytes`."""
+        return Habit.from_dict(_json.loads(raw))
+
+
+# ----------------- Registry Class -----------------
+class HabitRegistry:
+    """
+    Ordered collection of habits with a per-periodicity index.
+
+    Behaves like a list of habits for iteration, indexing, len(), append()
+    and pop(), and additionally keeps one list per periodicity up to date,
+    so filtering by periodicity does not scan every habit.
+    """
+
+    __slots__ = ("_habits", "_by_period")
+
+    def __init__(self, habits: Iterable[Habit] = ()) -> None:
+        self._habits: List[Habit] = []
+        self._by_period: Dict[str, List[Habit]] = {p: [] for p in sorted(VALID_PERIODICITIES)}
+        for h in habits:
+            self.append(h)
+
+    def __iter__(self) -> Iterator[Habit]:
+        return iter(self._habits)
+
+    def __len__(self) -> int:
+        return len(self._habits)
+
+    def __getitem__(self, index: int) -> Habit:
+        return self._habits[index]
+
+    def append(self, habit: Habit) -> None:
+        """Add a habit at the end and index it by periodicity."""
+        self._habits.append(habit)
+        self._by_period[habit.periodicity].append(habit)
+
+    def pop(self, index: int = -1) -> Habit:
+        """Remove and return the habit at `index` (default: last)."""
+        habit = self._habits.pop(index)
+        bucket = self._by_period[habit.periodicity]
+        # Remove by identity: distinct habits may compare equal
+        del bucket[next(i for i, h in enumerate(bucket) if h is habit)]
+        return habit
+
+    def by_periodicity(self, periodicity: str) -> List[Habit]:
+        """Return the habits with the given periodicity, in insertion order."""
+        return list(self._by_period.get(periodicity, ()))
@@ -10,12 +10,12 @@ Each habit has 4 weeks of completion events.
 
 import os
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 from .models import Habit, HabitEvent
 from .storage.json_store import save_habits, DEFAULT_DB_PATH
 
 
-def _generate_events(periodicity: str, weeks: int = 4) -> List[HabitEvent]:
+def _generate_events(periodicity: str, weeks: int = 4, now: Optional[datetime] = None) -> List[HabitEvent]:
     """
     Generate completion events for the last `weeks` weeks.
 
@@ -25,27 +25,26 @@ def _generate_events(periodicity: str, weeks: int = 4) -> List[HabitEvent]:
         Either 'daily' or 'weekly'.
     weeks : int
         Number of weeks of events to generate.
+    now : datetime, optional
+        Reference time for the most recent event. Defaults to current time.
 
     Returns
     -------
     List[HabitEvent]
         List of HabitEvent objects for given periodicity.
     """
-    now = datetime.now()
-    events: List[HabitEvent] = []
+    now = now or datetime.now()
     if periodicity == "daily":
         # One event per day for last N weeks
-        for i in range(7 * weeks):
-            day = now - timedelta(days=i)
-            events.append(HabitEvent(timestamp=day))
+        n, step = 7 * weeks, timedelta(days=1)
     elif periodicity == "weekly":
-        # One event per week for last N weeks (on Sundays)
-        for i in range(weeks):
-            week = now - timedelta(weeks=i)
-            events.append(HabitEvent(timestamp=week))
+        # One event per week for last N weeks (same weekday as `now`)
+        n, step = weeks, timedelta(weeks=1)
     else:
         raise ValueError("Invalid periodicity for event generation")
-    return list(reversed(events))  # chronological order
+    # Build directly in chronological order, ending at `now`
+    first = now - step * (n - 1)
+    return [HabitEvent(timestamp=first + step * i) for i in range(n)]
 
 
 def create_predefined_habits() -> List[Habit]:
@@ -57,12 +56,13 @@ def create_predefined_habits() -> List[Habit]:
     List[Habit]
         List of Habit objects with generated events.
     """
+    now = datetime.now()
     habits: List[Habit] = [
-        Habit(name="Workout", periodicity="daily", created_at=datetime.now(), events=_generate_events("daily")),
-        Habit(name="Read Book", periodicity="daily", created_at=datetime.now(), events=_generate_events("daily")),
-        Habit(name="Meditate", periodicity="daily", created_at=datetime.now(), events=_generate_events("daily")),
-        Habit(name="Weekly Review", periodicity="weekly", created_at=datetime.now(), events=_generate_events("weekly")),
-        Habit(name="Family Call", periodicity="weekly", created_at=datetime.now(), events=_generate_events("weekly")),
+        Habit(name="Workout", periodicity="daily", created_at=now, events=_generate_events("daily", now=now)),
+        Habit(name="Read Book", periodicity="daily", created_at=now, events=_generate_events("daily", now=now)),
+        Habit(name="Meditate", periodicity="daily", created_at=now, events=_generate_events("daily", now=now)),
+        Habit(name="Weekly Review", periodicity="weekly", created_at=now, events=_generate_events("weekly", now=now)),
+        Habit(name="Family Call", periodicity="weekly", created_at=now, events=_generate_events("weekly", now=now)),
     ]
     return habits
 
@@ -3,40 +3,105 @@ JSON persistence layer for Habit Tracker.
 
 Provides functions to load and save a list of Habit objects (with HabitEvents)
 from/to a JSON file in a safe and portable way.
+
+Paths ending in ".mp" are stored as MessagePack instead (requires the
+optional `msgpack` package): same layout, smaller and faster to parse
+for long histories.
 """
 
-import json
 import os
-from typing import List
+from typing import Any, Dict, Iterable, List, Set, Tuple
+from .. import _json
 from ..models import Habit
 
+try:  # only needed for ".mp" databases
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+MSGPACK_SUFFIX = ".mp"
+
 # Default JSON database path (overridable with HABIT_DB_PATH env var)
 DEFAULT_DB_PATH = os.environ.get("HABIT_DB_PATH", os.path.join("data", "habits.json"))
 
+# Parsed habit dicts of the last file read or written, per path, keyed on
+# (st_mtime_ns, st_size) so an unchanged file is not read and parsed again.
+_cache: Dict[str, Tuple[int, int, List[Dict[str, Any]]]] = {}
+
+
+# Directories already created/checked by _ensure_dir in this process
+_ensured_dirs: Set[str] = set()
+
 
 def _ensure_dir(path: str) -> None:
     """
     Ensure the directory for the given path exists.
+    Each directory is only checked once per process.
     """
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    d = os.path.dirname(path)
+    if d and d not in _ensured_dirs:
+        os.makedirs(d, exist_ok=True)
+        _ensured_dirs.add(d)
+
+
+def _require_msgpack() -> None:
+    if msgpack is None:
+        raise ImportError(f"msgpack is required for '{MSGPACK_SUFFIX}' habit databases")
 
 
-def save_habits(habits: List[Habit], path: str = DEFAULT_DB_PATH) -> None:
+def _dumps(data: Any, path: str) -> bytes:
+    """Serialize `data` for `path`: MessagePack for '.mp', else indented UTF-8 JSON."""
+    if path.endswith(MSGPACK_SUFFIX):
+        _require_msgpack()
+        return msgpack.packb(data, use_bin_type=True)
+    return _json.dumps(data, indent=True)
+
+
+def _loads(raw: bytes, path: str) -> Any:
+    """Parse bytes read from `path` (see `_dumps`)."""
+    if path.endswith(MSGPACK_SUFFIX):
+        _require_msgpack()
+        return msgpack.unpackb(raw, raw=False)
+    return _json.loads(raw)
+
+
+def _remember(path: str, habit_dicts: List[Dict[str, Any]]) -> None:
+    """Cache the habit dicts that `path` currently holds."""
+    st = os.stat(path)
+    _cache[path] = (st.st_mtime_ns, st.st_size, habit_dicts)
+
+
+def save_habits(habits: Iterable[Habit], path: str = DEFAULT_DB_PATH) -> None:
     """
     Persist the given habits (including events) to a JSON file.
 
+    The data is written to a temporary file next to `path`, flushed to disk
+    and then atomically renamed over `path`, so a crash mid-write never
+    leaves a truncated database behind.
+
     Parameters
     ----------
-    habits : List[Habit]
-        List of Habit objects to save.
+    habits : Iterable[Habit]
+        Habit objects to save (a list or a HabitRegistry).
     path : str
-        Path to the JSON file. Defaults to HABIT_DB_PATH or 'data/habits.json'.
+        Path to the JSON file (or '.mp' MessagePack file). Defaults to
+        HABIT_DB_PATH or 'data/habits.json'.
     """
     try:
         _ensure_dir(path)
-        data = {"habits": [h.to_dict() for h in habits]}
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        habit_dicts = [h.to_dict() for h in habits]
+        data = _dumps({"habits": habit_dicts}, path)
+        tmp = path + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        _remember(path, habit_dicts)
     except (OSError, IOError) as e:
         print(f"[ERROR] Failed to save habits to {path}: {e}")
 
@@ -45,10 +110,15 @@ def load_habits(path: str = DEFAULT_DB_PATH) -> List[Habit]:
     """
     Load habits (including events) from a JSON file.
 
+    If the file's mtime and size match the last save/load of `path`, the
+    cached parse is reused and the file is not read again. Fresh Habit
+    objects are built either way.
+
     Parameters
     ----------
     path : str
-        Path to the JSON file. Defaults to HABIT_DB_PATH or 'data/habits.json'.
+        Path to the JSON file (or '.mp' MessagePack file). Defaults to
+        HABIT_DB_PATH or 'data/habits.json'.
 
     Returns
     -------
@@ -58,9 +128,15 @@ def load_habits(path: str = DEFAULT_DB_PATH) -> List[Habit]:
     if not os.path.exists(path):
         return []
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            raw = json.load(f)
-        return [Habit.from_dict(d) for d in raw.get("habits", [])]
-    except (OSError, IOError, json.JSONDecodeError) as e:
+        st = os.stat(path)
+        cached = _cache.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            habit_dicts = cached[2]
+        else:
+            with open(path, "rb") as f:
+                habit_dicts = _loads(f.read(), path).get("habits", [])
+            _remember(path, habit_dicts)
+        return [Habit.from_dict(d) for d in habit_dicts]
+    except (OSError, IOError, ValueError) as e:  # JSONDecodeError and msgpack errors are ValueErrors
         print(f"[ERROR] Failed to load habits from {path}: {e}")
         return []
@@ -4,21 +4,18 @@ longest_run_streak_for, longest_run_streak_all.
 """
 
 from datetime import datetime, timedelta
-from habit_tracker.models import Habit
+from habit_tracker.models import Habit, HabitRegistry
 from habit_tracker.analytics.analytics import (
-    list_all, list_by_periodicity, longest_run_streak_for, longest_run_streak_all
+    list_all, list_by_periodicity, group_by_periodicity, longest_run_streak_for, longest_run_streak_all
 )
 
 
 def _make_daily(name: str, start: datetime, days: int, skip_every: int = 0) -> Habit:
     h = Habit(name=name, periodicity="daily", created_at=start)
-    d = start
-    for i in range(days):
-        if skip_every and (i % skip_every == 0) and i != 0:
-            d += timedelta(days=1)
-            continue
-        h.check_off(d)
-        d += timedelta(days=1)
+    offsets = list(range(days))
+    if skip_every:
+        del offsets[skip_every::skip_every]  # every skip_every-th day except day 0
+    h.bulk_check_off([start + timedelta(days=i) for i in offsets])
     return h
 
 
@@ -30,6 +27,19 @@ def test_list_all_and_filter_by_periodicity():
     assert len(list_all(habits)) == 2
     daily_names = [h.name for h in list_by_periodicity(habits, "daily")]
     assert daily_names == ["A"]
+    groups = group_by_periodicity(habits)
+    assert [h.name for h in groups["daily"]] == ["A"]
+    assert [h.name for h in groups["weekly"]] == ["B"]
+
+
+def test_list_by_periodicity_uses_registry_index():
+    start = datetime(2025, 1, 1)
+    registry = HabitRegistry([Habit("A", "daily", start), Habit("B", "weekly", start)])
+    registry.append(Habit("C", "daily", start))
+    assert [h.name for h in list_by_periodicity(registry, "daily")] == ["A", "C"]
+    assert registry.pop(0).name == "A"
+    assert [h.name for h in list_by_periodicity(registry, "daily")] == ["C"]
+    assert [h.name for h in list_all(registry)] == ["B", "C"]
 
 
 def test_longest_streak_for_daily_with_gap():
@@ -52,3 +62,29 @@ def test_longest_streak_all_daily_and_weekly():
     name, streak = longest_run_streak_all([h1, h2])
     assert name in ("Read", "Weekly Review")
     assert streak == 4
+
+
+def test_longest_streak_for_across_year_boundary():
+    daily = _make_daily("Journal", datetime(2024, 12, 30, 7, 0), 4)  # Dec 30 -> Jan 2
+    assert longest_run_streak_for(daily) == 4
+
+    weekly = Habit("Plan", "weekly", datetime(2024, 12, 1))
+    # ISO weeks 2024-W51, 2024-W52, 2025-W01 (starts Mon 2024-12-30), 2025-W02
+    for d in [datetime(2024, 12, 20), datetime(2024, 12, 27), datetime(2024, 12, 31), datetime(2025, 1, 8)]:
+        weekly.check_off(d)
+    assert longest_run_streak_for(weekly) == 4
+
+
+def test_make_daily_skips_every_nth_day():
+    h = _make_daily("Walk", datetime(2025, 1, 1), 10, skip_every=3)
+    assert [ev.timestamp.day for ev in h.events] == [1, 2, 3, 5, 6, 8, 9]
+    assert longest_run_streak_for(h) == 3
+
+
+def test_longest_streak_all_follows_new_check_offs():
+    start = datetime(2025, 1, 1, 8, 0)
+    h1 = _make_daily("Read", start, 4)
+    h2 = _make_daily("Run", start, 3)
+    assert longest_run_streak_all([h1, h2]) == ("Read", 4)
+    h2.bulk_check_off([start + timedelta(days=3), start + timedelta(days=4)])
+    assert longest_run_streak_all([h1, h2]) == ("Run", 5)
@@ -48,3 +48,110 @@ def test_longest_streak_weekly_with_gap():
     for d in [0, 7, 21, 28]:  # skipping week at day=14
         h.check_off(start + timedelta(days=d))
     assert h.longest_streak() == 2
+
+
+def test_longest_streak_updates_incrementally_out_of_order():
+    start = datetime(2025, 1, 1, 9, 0)
+    h = Habit("Run", "daily", start)
+    # Two separate runs (days 0-1 and 3-4), then the gap day fills in late
+    for day in [3, 0, 4, 1, 1]:
+        h.check_off(start + timedelta(days=day))
+    assert h.longest_streak() == 2
+    h.check_off(start + timedelta(days=2))
+    assert h.longest_streak() == 5
+    keys = h.unique_completed_periods()
+    assert keys == list(range(keys[0], keys[0] + 5))
+    assert Habit.from_dict(h.to_dict()).longest_streak() == 5
+
+
+def test_serialization_columnar_and_legacy_layouts():
+    h = Habit("Read", "daily", datetime(2025, 1, 1))
+    h.check_off(datetime(2025, 1, 1, 10, 30, 15))
+    h.check_off(datetime(2025, 1, 2, 8, 0), status="skipped")
+
+    d = h.to_dict()
+    assert "events" not in d
+    assert d["event_status"] == ["completed", "skipped"]
+    assert Habit.from_dict(d).events == h.events
+
+    legacy = {
+        "name": "Read",
+        "periodicity": "daily",
+        "created_at": "2025-01-01T00:00:00",
+        "events": [ev.to_dict() for ev in h.events],
+    }
+    assert Habit.from_dict(legacy).events == h.events
+
+
+def test_current_streak_tracks_latest_run():
+    start = datetime(2025, 1, 1)
+    h = Habit("Weekly Review", "weekly", start)
+    assert h.current_streak() == 0
+    for d in [0, 7, 14, 28]:  # 3-week run, gap, then a new run
+        h.check_off(start + timedelta(days=d))
+    assert (h.longest_streak(), h.current_streak()) == (3, 1)
+    h.check_off(start + timedelta(days=35))
+    h.check_off(start + timedelta(days=21))  # late entry bridges both runs
+    assert (h.longest_streak(), h.current_streak()) == (6, 6)
+
+
+def test_streak_index_rebuild_matches_incremental_updates():
+    import random
+
+    rng = random.Random(7)
+    start = datetime(2024, 12, 20, 6, 0)
+    for periodicity in ("daily", "weekly"):
+        h = Habit("X", periodicity, start)
+        for day in rng.sample(range(120), 70):
+            h.check_off(start + timedelta(days=day, hours=rng.randrange(18)))
+        rebuilt = Habit.from_dict(h.to_dict())
+        assert rebuilt.unique_completed_periods() == h.unique_completed_periods()
+        assert rebuilt.longest_streak() == h.longest_streak()
+        assert rebuilt.current_streak() == h.current_streak()
+
+
+def test_bulk_check_off_matches_check_off():
+    start = datetime(2025, 1, 1, 9, 0)
+    days = [5, 0, 1, 2, 4, 2]
+    one_by_one = Habit("Run", "daily", start)
+    for day in days:
+        one_by_one.check_off(start + timedelta(days=day))
+    bulk = Habit("Run", "daily", start)
+    bulk.bulk_check_off(start + timedelta(days=day) for day in days)
+    assert bulk == one_by_one
+    assert bulk.longest_streak() == one_by_one.longest_streak() == 3
+    assert bulk.unique_completed_periods() == one_by_one.unique_completed_periods()
+
+
+def test_to_bytes_roundtrip():
+    h = Habit("Read", "daily", datetime(2025, 1, 1))
+    h.bulk_check_off([datetime(2025, 1, 1, 10, 0), datetime(2025, 1, 2, 11, 0)])
+    raw = h.to_bytes()
+    assert isinstance(raw, bytes)
+    h2 = Habit.from_bytes(raw)
+    assert h2 == h
+    assert h2.longest_streak() == 2
+
+
+def test_events_stay_chronological():
+    start = datetime(2025, 1, 1, 9, 0)
+    h = Habit("Run", "daily", start)
+    h.check_off(start + timedelta(days=2))
+    h.check_off(start, status="skipped")
+    h.check_off(start + timedelta(days=1))
+    assert [ev.timestamp.day for ev in h.events] == [1, 2, 3]
+    assert [ev.status for ev in h.events] == ["skipped", "completed", "completed"]
+
+    h.bulk_check_off([start - timedelta(days=1)])
+    assert h.events[0].timestamp == start - timedelta(days=1)
+    assert h.longest_streak() == 4
+
+
+def test_custom_status_roundtrip():
+    h = Habit("Swim", "weekly", datetime(2025, 1, 1))
+    h.check_off(datetime(2025, 1, 6), status="partial")
+    h.check_off(datetime(2025, 1, 13))
+    assert [ev.status for ev in h.events] == ["partial", "completed"]
+    h2 = Habit.from_dict(h.to_dict())
+    assert h2 == h
+    assert h2.to_dict()["event_status"] == ["partial", "completed"]
@@ -0,0 +1,96 @@
+"""
+Unit tests for the JSON persistence layer: save_habits / load_habits.
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from habit_tracker.models import Habit
+from habit_tracker.storage import json_store
+from habit_tracker.storage.json_store import load_habits, save_habits
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    path = str(tmp_path / "db" / "habits.json")
+    start = datetime(2025, 1, 1, 9, 0)
+    h = Habit("Run", "daily", start)
+    for day in [0, 1, 2, 4]:
+        h.check_off(start + timedelta(days=day))
+    save_habits([h, Habit("Plan", "weekly", start)], path)
+
+    loaded = load_habits(path)
+    assert [x.name for x in loaded] == ["Run", "Plan"]
+    assert loaded[0].events == h.events
+    assert loaded[0].longest_streak() == 3
+
+
+def test_load_missing_or_corrupted_returns_empty(tmp_path):
+    path = tmp_path / "habits.json"
+    assert load_habits(str(path)) == []
+    path.write_text("{not json")
+    assert load_habits(str(path)) == []
+
+
+def test_failed_save_keeps_previous_database(tmp_path, monkeypatch):
+    path = tmp_path / "habits.json"
+    save_habits([Habit("Run", "daily", datetime(2025, 1, 1))], str(path))
+    before = path.read_bytes()
+
+    def boom(*_args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("os.replace", boom)
+    save_habits([], str(path))
+    assert path.read_bytes() == before
+    assert not (tmp_path / "habits.json.tmp").exists()
+
+
+def test_load_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    path = str(tmp_path / "habits.json")
+    h = Habit("Run", "daily", datetime(2025, 1, 1))
+    h.check_off(datetime(2025, 1, 1, 9, 0))
+    save_habits([h], path)
+
+    monkeypatch.setattr("builtins.open", None)  # any read would fail
+    first, second = load_habits(path), load_habits(path)
+    assert first[0].events == h.events
+    assert first[0] is not second[0]
+    monkeypatch.undo()
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"habits": []}')
+    assert load_habits(path) == []
+
+
+def test_msgpack_roundtrip(tmp_path):
+    pytest.importorskip("msgpack")
+    path = str(tmp_path / "habits.mp")
+    h = Habit("Plan", "weekly", datetime(2025, 1, 1))
+    for d in [datetime(2025, 1, 6), datetime(2025, 1, 13)]:
+        h.check_off(d)
+    save_habits([h], path)
+    json_store._cache.clear()
+    loaded = load_habits(path)
+    assert loaded[0].events == h.events
+    assert loaded[0].longest_streak() == 2
+
+
+def test_msgpack_path_requires_msgpack(tmp_path, monkeypatch):
+    monkeypatch.setattr(json_store, "msgpack", None)
+    with pytest.raises(ImportError):
+        save_habits([], str(tmp_path / "habits.mp"))
+
+
+def test_load_bundled_seed_data():
+    path = Path(__file__).resolve().parents[1] / "data" / "habits.json"
+    habits = load_habits(str(path))
+    assert len(habits) == 5
+    assert all(h.events for h in habits)
+
+
+def test_save_to_bare_filename(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    save_habits([Habit("Run", "daily", datetime(2025, 1, 1))], "habits.json")
+    assert [h.name for h in load_habits("habits.json")] == ["Run"]